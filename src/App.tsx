@@ -1,7 +1,7 @@
 import { useState, useCallback, useEffect, useMemo, useRef } from 'react'
-import type { Word } from './types'
+import type { Word, ReadingPosition } from './types'
 import { parseVerseText, parseSefariaResponse, insertAliyahMarkers } from './utils/hebrew'
-import { fetchSefariaText, fetchAliyot, parseAliyotRefs, fetchParashot, STATIC_PARASHOT, TANACH_BOOKS } from './utils/sefaria'
+import { fetchSefariaText, fetchAliyot, parseAliyotRefs, fetchParashot, STATIC_PARASHOT, TANACH_BOOKS_BY_NAME } from './utils/sefaria'
 import { savePosition, loadPosition, saveHighlights, loadHighlights, saveSpeed, loadSpeed } from './utils/storage'
 import { getCurrentUser, loadUserData, saveUserData, logoutUser, refreshUserData } from './utils/auth'
 import type { UserData } from './utils/auth'
@@ -18,6 +18,8 @@ import sefariaLogo from './assets/powered-by-sefaria.svg'
 import { KEYBOARD_SEEK_WORDS, wpmToMs, msToWpm } from './config/playbackConfig'
 
 const THEME_STORAGE_KEY = 'leining-theme'
+// Minimum interval between localStorage writes of the reading position
+const POSITION_SAVE_INTERVAL_MS = 500
 
 export default function App() {
   const [words, setWords] = useState<Word[]>([])
@@ -94,12 +96,32 @@ export default function App() {
   useEffect(() => { bookInfoRef.current = bookInfo }, [bookInfo])
   useEffect(() => { highlightedWordsRef.current = highlightedWords }, [highlightedWords])
 
+  // Position writes are coalesced: every word change records the latest
+  // position, and at most one localStorage write happens per interval.
+  const pendingPositionRef = useRef<ReadingPosition | null>(null)
+  const positionTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null)
+
+  const flushPosition = useCallback(() => {
+    if (positionTimerRef.current !== null) {
+      clearTimeout(positionTimerRef.current)
+      positionTimerRef.current = null
+    }
+    if (pendingPositionRef.current) {
+      savePosition(pendingPositionRef.current)
+      pendingPositionRef.current = null
+    }
+  }, [])
+
+  // Don't lose the last position when the tab is closed mid-interval
+  useEffect(() => {
+    window.addEventListener('pagehide', flushPosition)
+    return () => {
+      window.removeEventListener('pagehide', flushPosition)
+      flushPosition()
+    }
+  }, [flushPosition])
+
   const handleWordChange = useCallback((index: number) => {
-    setWords((prev) =>
-      prev.map((w) =>
-        w.index === index ? { ...w, revealed: true } : w
-      )
-    )
     const word = wordsRef.current[index]
     // Update browser URL when the verse changes
     if (word?.chapter !== undefined && word?.verse !== undefined) {
@@ -115,13 +137,16 @@ export default function App() {
       }
     }
     // Persist position
-    savePosition({
+    pendingPositionRef.current = {
       book: bookInfoRef.current.book,
       chapter: bookInfoRef.current.chapter,
       verse: bookInfoRef.current.startVerse,
       wordIndex: index,
-    })
-  }, [])
+    }
+    if (positionTimerRef.current === null) {
+      positionTimerRef.current = setTimeout(flushPosition, POSITION_SAVE_INTERVAL_MS)
+    }
+  }, [flushPosition])
 
   const { currentWordIndex, isPlaying, speed, setCurrentWordIndex, setSpeed, play, pause, toggle } =
     usePlayback({ words, speed: initialSpeed, onWordChange: handleWordChange })
@@ -414,13 +439,13 @@ export default function App() {
 
   const handleNextChapter = useCallback(() => {
     if (!bookInfoRef.current.book) return
-    const bookMeta = TANACH_BOOKS.find((b) => b.name === bookInfoRef.current.book)
+    const bookMeta = TANACH_BOOKS_BY_NAME.get(bookInfoRef.current.book)
     if (bookMeta && bookInfoRef.current.chapter >= bookMeta.chapters) return
     const nextChapter = bookInfoRef.current.chapter + 1
     loadText(`${bookInfoRef.current.book} ${nextChapter}`, bookInfoRef.current.book, nextChapter, 1)
   }, [loadText])
 
-  const currentBookMeta = TANACH_BOOKS.find((b) => b.name === bookInfo.book)
+  const currentBookMeta = TANACH_BOOKS_BY_NAME.get(bookInfo.book)
   const hasPrevChapter = !!bookInfo.book && bookInfo.chapter > 1
   const hasNextChapter = !!currentBookMeta && bookInfo.chapter < currentBookMeta.chapters
 
@@ -1,5 +1,5 @@
-import { useState, useEffect, useRef } from 'react'
-import { TANACH_BOOKS, STATIC_PARASHOT, fetchParashot, type Parasha } from '../utils/sefaria'
+import { useState, useEffect, useMemo, useRef } from 'react'
+import { TANACH_BOOKS, TANACH_BOOKS_BY_NAME, STATIC_PARASHOT, fetchParashot, type Parasha } from '../utils/sefaria'
 import styles from './Navigation.module.css'
 
 const TORAH_BOOKS = ['Genesis', 'Exodus', 'Leviticus', 'Numbers', 'Deuteronomy'] as const
@@ -30,6 +30,10 @@ type Props = {
 
 type Mode = 'manual' | 'parasha'
 
+// Class lists for the Sefer Torah / reveal-all toggle buttons
+const TOGGLE_BTN_CLASS = styles.seferTorahBtn
+const TOGGLE_BTN_ACTIVE_CLASS = `${styles.seferTorahBtn} ${styles.seferTorahBtnActive}`
+
 /** Build a Sefaria URL for a given book, chapter and verse.
  *  Sefaria URLs use underscores for spaces in book names, e.g.
  *  https://www.sefaria.org/I_Samuel.1.1
@@ -58,7 +62,7 @@ export default function Navigation({ onLoad, useRashiFont, onRashiFontChange, ra
 
   // Sync dropdowns when the loaded book/chapter changes (e.g. from URL)
   useEffect(() => {
-    if (currentBook && TANACH_BOOKS.some((b) => b.name === currentBook)) {
+    if (currentBook && TANACH_BOOKS_BY_NAME.has(currentBook)) {
       setBook(currentBook)
     }
   }, [currentBook])
@@ -81,15 +85,25 @@ export default function Navigation({ onLoad, useRashiFont, onRashiFontChange, ra
     return () => document.removeEventListener('mousedown', handleClickOutside)
   }, [megaMenuOpen])
 
-  // Group parashot by Torah book in canonical order
-  const parashotByBook = TORAH_BOOKS.map((bookName) => ({
-    book: bookName,
-    parashot: parashot.filter((p) => p.book === bookName),
-  }))
+  // Group parashot by Torah book in canonical order. Navigation re-renders
+  // on every word advance (for the Sefaria link), so only regroup when the
+  // list itself changes.
+  const parashotByBook = useMemo(() => {
+    // Bucket in a single pass over the list rather than one filter per book
+    const groups = new Map<string, Parasha[]>(TORAH_BOOKS.map((bookName) => [bookName, []]))
+    for (const p of parashot) groups.get(p.book)?.push(p)
+    return TORAH_BOOKS.map((bookName) => ({
+      book: bookName,
+      parashot: groups.get(bookName) ?? [],
+    }))
+  }, [parashot])
 
-  const selectedParashaObj = parashot.find((p) => p.ref === selectedParasha)
+  // ref → parasha, rebuilt only when the list changes; the selection is
+  // looked up on every render
+  const parashaByRef = useMemo(() => new Map(parashot.map((p) => [p.ref, p])), [parashot])
+  const selectedParashaObj = parashaByRef.get(selectedParasha)
 
-  const selectedBook = TANACH_BOOKS.find((b) => b.name === book)
+  const selectedBook = TANACH_BOOKS_BY_NAME.get(book)
   const maxChapters = selectedBook?.chapters ?? 1
 
   const handleManualLoad = () => {
@@ -98,7 +112,7 @@ export default function Navigation({ onLoad, useRashiFont, onRashiFontChange, ra
   }
 
   const handleParashaLoad = () => {
-    const p = parashot.find((p) => p.ref === selectedParasha)
+    const p = selectedParashaObj
     if (!p) return
     // Parse the first chapter/verse from the parasha ref
     // e.g. "Genesis 1:1-6:8" -> book=Genesis, chapter=1, verse=1
@@ -243,7 +257,7 @@ export default function Navigation({ onLoad, useRashiFont, onRashiFontChange, ra
 
       {parashaLoaded && onSeferTorahModeToggle && (
         <button
-          className={[styles.seferTorahBtn, seferTorahMode ? styles.seferTorahBtnActive : ''].filter(Boolean).join(' ')}
+          className={seferTorahMode ? TOGGLE_BTN_ACTIVE_CLASS : TOGGLE_BTN_CLASS}
           onClick={onSeferTorahModeToggle}
           title={seferTorahMode ? 'חזרה למצב רגיל' : 'מצב ספר תורה'}
           aria-pressed={seferTorahMode}
@@ -254,7 +268,7 @@ export default function Navigation({ onLoad, useRashiFont, onRashiFontChange, ra
 
       {onRevealAllTaamimToggle && (
         <button
-          className={[styles.seferTorahBtn, revealAllTaamim ? styles.seferTorahBtnActive : ''].filter(Boolean).join(' ')}
+          className={revealAllTaamim ? TOGGLE_BTN_ACTIVE_CLASS : TOGGLE_BTN_CLASS}
           onClick={onRevealAllTaamimToggle}
           title={revealAllTaamim ? 'חזרה למצב רגיל' : 'הצג כל המילים עם טעמים'}
           aria-pressed={revealAllTaamim}
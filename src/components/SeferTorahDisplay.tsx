@@ -1,4 +1,4 @@
-import { useMemo } from 'react'
+import { memo, useMemo } from 'react'
 import type { Word } from '../types'
 import styles from './SeferTorahDisplay.module.css'
 
@@ -10,7 +10,7 @@ const COLUMN_WIDTH_PX = 280
 const COLUMN_GAP_PX = 32
 const APPROX_WORDS_PER_COLUMN = 65
 
-export default function SeferTorahDisplay({ words }: Props) {
+function SeferTorahDisplay({ words }: Props) {
   // Estimate container width based on word/break count so CSS columns have room to expand
   const containerWidth = useMemo(() => {
     let realWordCount = 0
@@ -59,3 +59,8 @@ export default function SeferTorahDisplay({ words }: Props) {
     </div>
   )
 }
+
+// The column layout only depends on the word list, which App replaces only
+// when a new text is loaded; skip re-rendering the whole scroll when App
+// re-renders for playback ticks or unrelated state.
+export default memo(SeferTorahDisplay)
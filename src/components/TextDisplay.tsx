@@ -1,4 +1,4 @@
-import { Fragment, useLayoutEffect, useMemo, useRef } from 'react'
+import { Fragment, memo, useEffect, useMemo, useRef } from 'react'
 import type React from 'react'
 import type { Word } from '../types'
 import styles from './TextDisplay.module.css'
@@ -18,34 +18,106 @@ type Props = {
   nextNav?: React.ReactNode
 }
 
+type WordSpanProps = {
+  index: number
+  text: string
+  wordKey: string
+  isActive: boolean
+  isPast: boolean
+  isHighlighted: boolean
+  useRashiFont?: boolean
+  activeRef: React.MutableRefObject<HTMLSpanElement | null>
+  onWordClick: (index: number) => void
+  onToggleHighlight?: (wordKey: string) => void
+}
+
+// Class names for every combination of word state flags, built once instead
+// of filtering and joining an array per word render.
+// Bits: 1 = active, 2 = past, 4 = normal font (active in Rashi mode), 8 = highlighted
+const WORD_CLASS_LUT: string[] = Array.from({ length: 16 }, (_, bits) =>
+  [
+    styles.word,
+    bits & 1 ? styles.active : '',
+    bits & 2 ? styles.past : '',
+    bits & 4 ? styles.normalFont : '',
+    bits & 8 ? styles.highlighted : '',
+  ]
+    .filter(Boolean)
+    .join(' '),
+)
+
+// The container only ever takes one of two class lists
+const CONTAINER_CLASS = styles.container
+const CONTAINER_RASHI_CLASS = `${styles.container} ${styles.rashiFont}`
+
+// Memoized so that advancing one word only re-renders the words whose
+// state actually changed (the previous and the new active word), not the
+// whole text.
+const WordSpan = memo(function WordSpan({ index, text, wordKey, isActive, isPast, isHighlighted, useRashiFont, activeRef, onWordClick, onToggleHighlight }: WordSpanProps) {
+  return (
+    <span
+      ref={isActive ? activeRef : null}
+      className={WORD_CLASS_LUT[
+        (isActive ? 1 : 0) |
+        (isPast ? 2 : 0) |
+        (isActive && useRashiFont ? 4 : 0) |
+        (isHighlighted ? 8 : 0)
+      ]}
+      onClick={() => onWordClick(index)}
+      onContextMenu={(e) => {
+        if (onToggleHighlight) {
+          e.preventDefault()
+          onToggleHighlight(wordKey)
+        }
+      }}
+      role="button"
+      tabIndex={0}
+      onKeyDown={(e) => {
+        if (e.key === 'Enter') onWordClick(index)
+        if (e.key === ' ') e.preventDefault()
+      }}
+    >
+      {text}
+    </span>
+  )
+})
+
 export default function TextDisplay({ words, currentWordIndex, onWordClick, useRashiFont, fontSize, rashiPractice, bookName, highlightedWords, onToggleHighlight, revealAllTaamim, prevNav, nextNav }: Props) {
   const activeRef = useRef<HTMLSpanElement | null>(null)
 
-  // Autoscroll: keep active word visible
-  useLayoutEffect(() => {
-    activeRef.current?.scrollIntoView({ behavior: 'smooth', block: 'center' })
+  // Autoscroll: keep active word visible. Deferred to the next animation
+  // frame so several index changes within one frame (fast seeking, high
+  // WPM) coalesce into a single scroll instead of forcing a synchronous
+  // layout before every commit.
+  useEffect(() => {
+    const frame = requestAnimationFrame(() => {
+      activeRef.current?.scrollIntoView({ behavior: 'smooth', block: 'center' })
+    })
+    return () => cancelAnimationFrame(frame)
   }, [currentWordIndex])
 
-  // Precompute each word's position within its verse for stable highlight keys
-  const posInVerseMap = useMemo(() => {
-    const map = new Map<number, number>()
+  // Precompute stable highlight keys (book|chapter|verse|position in verse).
+  // `words` is only replaced when a new text is loaded (playback does not
+  // touch it), so this runs once per text rather than on each word advance.
+  const wordKeyMap = useMemo(() => {
+    const map = new Map<number, string>()
     const counts = new Map<string, number>()
     for (const word of words) {
       if (word.breakType) continue
       const key = `${word.chapter ?? 0}:${word.verse ?? 0}`
       const pos = counts.get(key) ?? 0
-      map.set(word.index, pos)
+      map.set(word.index, `${bookName ?? ''}|${word.chapter ?? 0}|${word.verse ?? 0}|${pos}`)
       counts.set(key, pos + 1)
     }
     return map
-  }, [words])
+  }, [words, bookName])
 
   if (words.length === 0) {
     return <div className={styles.empty}>בחר קטע לקריאה</div>
   }
 
   return (
-    <div className={[styles.container, useRashiFont ? styles.rashiFont : ''].filter(Boolean).join(' ')} style={fontSize ? { fontSize } : undefined} dir="rtl">
+    <div className={useRashiFont ? CONTAINER_RASHI_CLASS : CONTAINER_CLASS} style={fontSize ? { fontSize } : undefined} dir="rtl">
       {prevNav}
       {words.map((word) => {
         // Render paragraph markers as visual breaks
@@ -67,39 +139,23 @@ export default function TextDisplay({ words, currentWordIndex, onWordClick, useR
           ? (isActive ? word.full : word.plain)
           : (revealAllTaamim || isPast || isActive ? word.full : word.plain)
 
-        const posInVerse = posInVerseMap.get(word.index) ?? 0
-        const wordKey = `${bookName ?? ''}|${word.chapter ?? 0}|${word.verse ?? 0}|${posInVerse}`
+        const wordKey = wordKeyMap.get(word.index) ?? ''
         const isHighlighted = highlightedWords?.has(wordKey) ?? false
 
         return (
           <Fragment key={word.index}>
-            <span
-              ref={isActive ? activeRef : null}
-              className={[
-                styles.word,
-                isActive ? styles.active : '',
-                isPast ? styles.past : '',
-                isActive && useRashiFont ? styles.normalFont : '',
-                isHighlighted ? styles.highlighted : '',
-              ]
-                .filter(Boolean)
-                .join(' ')}
-              onClick={() => onWordClick(word.index)}
-              onContextMenu={(e) => {
-                if (onToggleHighlight) {
-                  e.preventDefault()
-                  onToggleHighlight(wordKey)
-                }
-              }}
-              role="button"
-              tabIndex={0}
-              onKeyDown={(e) => {
-                if (e.key === 'Enter') onWordClick(word.index)
-                if (e.key === ' ') e.preventDefault()
-              }}
-            >
-              {displayText}
-            </span>
+            <WordSpan
+              index={word.index}
+              text={displayText}
+              wordKey={wordKey}
+              isActive={isActive}
+              isPast={isPast}
+              isHighlighted={isHighlighted}
+              useRashiFont={useRashiFont}
+              activeRef={activeRef}
+              onWordClick={onWordClick}
+              onToggleHighlight={onToggleHighlight}
+            />
             {' '}
           </Fragment>
         )
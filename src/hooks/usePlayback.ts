@@ -24,10 +24,17 @@ export function usePlayback({ words, speed: initialSpeed, onWordChange }: UsePla
   const [speed, setSpeed] = useState(initialSpeed)
 
   const timerRef = useRef<ReturnType<typeof setTimeout> | null>(null)
+  // performance.now() timestamp at which the pending advance is due
+  const nextDueRef = useRef(0)
   const currentIndexRef = useRef(currentWordIndex)
   const isPlayingRef = useRef(isPlaying)
   const speedRef = useRef(speed)
+  // Read through a ref so advance/play/setCurrentWordIndex keep their
+  // identity when a new text is loaded; otherwise every load would
+  // invalidate the memoized WordSpans and re-run the speed-restart effect
+  const wordsRef = useRef(words)
 
+  useEffect(() => { wordsRef.current = words }, [words])
   useEffect(() => { currentIndexRef.current = currentWordIndex }, [currentWordIndex])
   useEffect(() => { isPlayingRef.current = isPlaying }, [isPlaying])
   useEffect(() => { speedRef.current = speed }, [speed])
@@ -41,6 +48,7 @@ export function usePlayback({ words, speed: initialSpeed, onWordChange }: UsePla
 
   const advance = useCallback(() => {
     if (!isPlayingRef.current) return
+    const words = wordsRef.current
     let next = currentIndexRef.current + 1
     // Skip over marker words (paragraph breaks, aliyah markers)
     while (next < words.length && words[next].breakType) {
@@ -52,15 +60,27 @@ export function usePlayback({ words, speed: initialSpeed, onWordChange }: UsePla
     }
     setCurrentWordIndexState(next)
     onWordChange(next)
-    timerRef.current = setTimeout(advance, speedRef.current)
-  }, [words, onWordChange])
+    // Schedule against the planned beat rather than from "now", so timer
+    // lateness doesn't accumulate into drift over a long reading. If we fell
+    // more than a whole word behind (e.g. a throttled background tab),
+    // re-anchor instead of racing through the backlog.
+    const now = performance.now()
+    nextDueRef.current += speedRef.current
+    if (nextDueRef.current < now) nextDueRef.current = now + speedRef.current
+    timerRef.current = setTimeout(advance, nextDueRef.current - now)
+  }, [onWordChange])
+
+  const startTimer = useCallback((delay: number) => {
+    nextDueRef.current = performance.now() + delay
+    timerRef.current = setTimeout(advance, delay)
+  }, [advance])
 
   const play = useCallback(() => {
-    if (currentIndexRef.current >= words.length - 1) return
+    if (currentIndexRef.current >= wordsRef.current.length - 1) return
     setIsPlaying(true)
     isPlayingRef.current = true
-    timerRef.current = setTimeout(advance, speedRef.current)
-  }, [words.length, advance])
+    startTimer(speedRef.current)
+  }, [startTimer])
 
   const pause = useCallback(() => {
     clearTimer()
@@ -80,10 +100,10 @@ export function usePlayback({ words, speed: initialSpeed, onWordChange }: UsePla
   useEffect(() => {
     if (isPlaying) {
       clearTimer()
-      timerRef.current = setTimeout(advance, speed)
+      startTimer(speed)
     }
     return () => { clearTimer() }
-  }, [speed, isPlaying, advance, clearTimer])
+  }, [speed, isPlaying, startTimer, clearTimer])
 
   // Cleanup on unmount
   useEffect(() => () => clearTimer(), [clearTimer])
@@ -93,9 +113,9 @@ export function usePlayback({ words, speed: initialSpeed, onWordChange }: UsePla
     setCurrentWordIndexState(index)
     onWordChange(index)
     if (isPlayingRef.current) {
-      timerRef.current = setTimeout(advance, speedRef.current)
+      startTimer(speedRef.current)
     }
-  }, [clearTimer, onWordChange, advance])
+  }, [clearTimer, onWordChange, startTimer])
 
   return {
     currentWordIndex,
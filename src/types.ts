@@ -3,7 +3,6 @@ export type Word = {
   plain: string
   full: string
   taam: string | null
-  revealed: boolean
   chapter?: number
   verse?: number
   breakType?: 'petuchah' | 'setumah' | 'aliyah'
@@ -1,6 +1,44 @@
 import type { Word } from '../types'
 import type { AliyahMarker } from './sefaria'
 
+// Patterns used on every token are compiled once at module load.
+// Niqqud and ta'amim (U+0591–U+05C7), excluding maqaf (U+05BE)
+const DIACRITICS_RE = /[\u0591-\u05BD\u05BF-\u05C7]/g
+// Cantillation marks only (U+0591–U+05AF)
+const TAAM_RE = /[\u0591-\u05AF]/
+const PASEQ_RE = /\u05C0/g
+const PARAGRAPH_MARKER_RE = /\{[פס]\}/g
+const TOKEN_RE = /\S+/g
+const THINSP_RE = /&thinsp;/g
+const NBSP_RE = /&nbsp;/g
+const HTML_TAG_RE = /<[^>]*>/g
+const ANGLE_BRACKET_RE = /[<>]/g
+const HTML_ENTITY_RE = /&#?[a-zA-Z0-9]+;/g
+
+// Recently used tokens (least recently used first). The same words recur
+// constantly within a text, and the Rashi practice text is re-parsed in
+// full on every keystroke.
+const TOKEN_CACHE_SIZE = 1024
+const tokenCache = new Map<string, { plain: string; taam: string | null }>()
+
+/** stripDiacritics + extractTaam for one token, memoized. */
+function analyzeToken(full: string): { plain: string; taam: string | null } {
+  const cached = tokenCache.get(full)
+  if (cached) {
+    // Move to the most-recently-used end so frequent words stay cached
+    tokenCache.delete(full)
+    tokenCache.set(full, cached)
+    return cached
+  }
+  const result = { plain: stripDiacritics(full), taam: extractTaam(full) }
+  tokenCache.set(full, result)
+  if (tokenCache.size > TOKEN_CACHE_SIZE) {
+    const oldest = tokenCache.keys().next().value
+    if (oldest !== undefined) tokenCache.delete(oldest)
+  }
+  return result
+}
+
 /**
  * Parse a Sefaria API 'he' field (string, string[], or string[][]) into Word
  * objects with per-word chapter/verse metadata preserved.
@@ -21,29 +59,29 @@ export function parseSefariaResponse(
     if (!text || typeof text !== 'string') return
     const raw = stripHtml(text)
     // Ensure {פ} and {ס} paragraph markers are separated from surrounding text
-    const processed = raw.replace(/\{[פס]\}/g, ' $& ')
-    const tokens = processed.split(/\s+/).filter((t) => t.length > 0)
+    // (most verses have none, so skip building a padded copy for those)
+    const processed = raw.includes('{') ? raw.replace(PARAGRAPH_MARKER_RE, ' $& ') : raw
+    const tokens = processed.match(TOKEN_RE) ?? []
     for (const full of tokens) {
       // Handle paragraph markers as visual breaks (not words)
       if (full === '{פ}') {
-        words.push({ index: wordIndex++, plain: '', full: '{פ}', taam: null, revealed: false, chapter, verse, breakType: 'petuchah' })
+        words.push({ index: wordIndex++, plain: '', full: '{פ}', taam: null, chapter, verse, breakType: 'petuchah' })
         continue
       }
       if (full === '{ס}') {
-        words.push({ index: wordIndex++, plain: '', full: '{ס}', taam: null, revealed: false, chapter, verse, breakType: 'setumah' })
+        words.push({ index: wordIndex++, plain: '', full: '{ס}', taam: null, chapter, verse, breakType: 'setumah' })
         continue
       }
-      // Skip standalone paseq (U+05C0) tokens
-      if (/^[\u05C0]+$/.test(full)) continue
-      // Strip paseq from tokens that mix it with Hebrew text
-      const stripped = full.replace(/\u05C0/g, '')
+      // Strip paseq (U+05C0) from tokens that contain it; standalone paseq
+      // tokens become empty and are skipped. Tokens without one are used as-is.
+      const stripped = full.includes('\u05C0') ? full.replace(PASEQ_RE, '') : full
       if (!stripped) continue
+      const { plain, taam } = analyzeToken(stripped)
       words.push({
         index: wordIndex++,
-        plain: stripDiacritics(stripped),
+        plain,
         full: stripped,
-        taam: extractTaam(stripped),
-        revealed: false,
+        taam,
         chapter,
         verse,
       })
@@ -79,7 +117,7 @@ export function parseSefariaResponse(
  */
 export function stripDiacritics(text: string): string {
   // Remove Hebrew diacritics (niqqud and taamim), but keep maqaf (\u05BE)
-  return text.replace(/[\u0591-\u05BD\u05BF-\u05C7]/g, '')
+  return text.replace(DIACRITICS_RE, '')
 }
 
 /**
@@ -87,7 +125,7 @@ export function stripDiacritics(text: string): string {
  * Returns the first ta'am character found, or null.
  */
 export function extractTaam(text: string): string | null {
-  const match = text.match(/[\u0591-\u05AF]/)
+  const match = text.match(TAAM_RE)
   return match ? match[0] : null
 }
 
@@ -97,11 +135,11 @@ export function extractTaam(text: string): string | null {
  */
 export function stripHtml(text: string): string {
   return text
-    .replace(/&thinsp;/g, ' ')
-    .replace(/&nbsp;/g, ' ')
-    .replace(/<[^>]*>/g, '')
-    .replace(/[<>]/g, '')
-    .replace(/&#?[a-zA-Z0-9]+;/g, '')
+    .replace(THINSP_RE, ' ')
+    .replace(NBSP_RE, ' ')
+    .replace(HTML_TAG_RE, '')
+    .replace(ANGLE_BRACKET_RE, '')
+    .replace(HTML_ENTITY_RE, '')
 }
 
 /**
@@ -113,16 +151,20 @@ export function parseVerseText(verseText: string | string[]): Word[] {
     ? verseText.map(stripHtml).join(' ')
     : stripHtml(verseText)
 
-  // Split by whitespace – preserving the original tokens (fully vocalized)
-  const tokens = raw.split(/\s+/).filter((t) => t.length > 0)
-
-  return tokens.map((full, i) => ({
-    index: i,
-    plain: stripDiacritics(full),
-    full,
-    taam: extractTaam(full),
-    revealed: false,
-  }))
+  // Split by whitespace – preserving the original tokens (fully vocalized).
+  // match() yields the non-empty tokens in one pass, without the empty
+  // strings split() leaves at the edges.
+  const tokens = raw.match(TOKEN_RE) ?? []
+
+  return tokens.map((full, i) => {
+    const { plain, taam } = analyzeToken(full)
+    return {
+      index: i,
+      plain,
+      full,
+      taam,
+    }
+  })
 }
 
 /**
@@ -154,7 +196,6 @@ export function insertAliyahMarkers(words: Word[], markers: AliyahMarker[]): Wor
           plain: '',
           full: marker.heLabel,
           taam: null,
-          revealed: true,
           chapter: word.chapter,
           verse: word.verse,
           breakType: 'aliyah',
@@ -1,3 +1,5 @@
+import { loadAliyotRefs, saveAliyotRefs } from './storage'
+
 const BASE_URL = 'https://www.sefaria.org/api'
 
 export type SefariaTextResponse = {
@@ -8,12 +10,40 @@ export type SefariaTextResponse = {
   categories?: string[]
 }
 
+// Recently fetched texts, keyed by ref (least recently used first).
+// Pressing "Load" again or paging back to a chapter reuses the pending or
+// settled request instead of downloading the same text again.
+const TEXT_CACHE_SIZE = 4
+const textCache = new Map<string, Promise<SefariaTextResponse>>()
+
 /**
  * Fetch a range of verses from Sefaria.
  * ref format: e.g. "Genesis.1.1-3" or "Genesis.1.1"
  * lang=he fetches only Hebrew text.
  */
-export async function fetchSefariaText(ref: string): Promise<SefariaTextResponse> {
+export function fetchSefariaText(ref: string): Promise<SefariaTextResponse> {
+  const cached = textCache.get(ref)
+  if (cached) {
+    // Move to the most-recently-used end
+    textCache.delete(ref)
+    textCache.set(ref, cached)
+    return cached
+  }
+
+  const request = requestSefariaText(ref)
+  textCache.set(ref, request)
+  if (textCache.size > TEXT_CACHE_SIZE) {
+    const oldest = textCache.keys().next().value
+    if (oldest !== undefined) textCache.delete(oldest)
+  }
+  // Don't keep failed requests around; the next attempt should retry
+  request.catch(() => {
+    if (textCache.get(ref) === request) textCache.delete(ref)
+  })
+  return request
+}
+
+async function requestSefariaText(ref: string): Promise<SefariaTextResponse> {
   const url = `${BASE_URL}/texts/${encodeURIComponent(ref)}?lang=he&context=0&pad=0`
   const response = await fetch(url)
   if (!response.ok) {
@@ -126,18 +156,23 @@ function expandSefariaRef(ref: string): string {
   return ref.replace(/(\d+):(\d+)-(\d+)$/, '$1:$2-$1:$3')
 }
 
-export async function fetchParashot(): Promise<Parasha[]> {
-  if (parashotCache) return parashotCache
-
-  // The Sefaria API exposes per-book index endpoints (e.g. /api/index/Leviticus)
-  // but not a combined /api/index/Torah endpoint.  Fetch each Torah book in
-  // parallel to build a lookup map: normalized wholeRef → aliyot refs.
+/**
+ * The Sefaria API exposes per-book index endpoints (e.g. /api/index/Leviticus)
+ * but not a combined /api/index/Torah endpoint.  Fetch each Torah book in
+ * parallel to build a lookup map: normalized wholeRef → aliyot refs.
+ * The map is persisted only if every book was fetched successfully.
+ */
+async function fetchAliyotByRef(): Promise<Map<string, string[]>> {
   const aliyotByRef = new Map<string, string[]>()
+  let complete = true
   try {
     await Promise.all(
       ['Genesis', 'Exodus', 'Leviticus', 'Numbers', 'Deuteronomy'].map(async (bookName) => {
         const resp = await fetch(`${BASE_URL}/index/${bookName}`)
-        if (!resp.ok) return
+        if (!resp.ok) {
+          complete = false
+          return
+        }
         const data = (await resp.json()) as {
           alts?: { Parasha?: { nodes?: Array<{ wholeRef: string; refs?: string[] }> } }
         }
@@ -150,7 +185,18 @@ export async function fetchParashot(): Promise<Parasha[]> {
     )
   } catch {
     // If the index API is unreachable, continue without aliyotRefs.
+    complete = false
   }
+  if (complete && aliyotByRef.size > 0) saveAliyotRefs(aliyotByRef)
+  return aliyotByRef
+}
+
+export async function fetchParashot(): Promise<Parasha[]> {
+  if (parashotCache) return parashotCache
+
+  // The aliyah divisions change only when Sefaria edits its index, so reuse
+  // the refs stored by a previous page load when they are recent enough.
+  const aliyotByRef = loadAliyotRefs() ?? await fetchAliyotByRef()
 
   // Populate aliyotRefs on STATIC_PARASHOT entries by matching wholeRef.
   // Combined parashot (e.g. Vayakhel-Pekudei) are already present in
@@ -275,3 +321,10 @@ export const TANACH_BOOKS: { name: string; hebrewName: string; chapters: number
   { name: 'I Chronicles', hebrewName: 'דִּבְרֵי הַיָּמִים א', chapters: 29 },
   { name: 'II Chronicles', hebrewName: 'דִּבְרֵי הַיָּמִים ב', chapters: 36 },
 ]
+
+/**
+ * TANACH_BOOKS indexed by English name, for constant-time lookups of a
+ * book's metadata (e.g. its chapter count).
+ */
+export const TANACH_BOOKS_BY_NAME: ReadonlyMap<string, (typeof TANACH_BOOKS)[number]> =
+  new Map(TANACH_BOOKS.map((b) => [b.name, b]))
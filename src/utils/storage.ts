@@ -3,6 +3,8 @@ import type { ReadingPosition } from '../types'
 const STORAGE_KEY = 'leining_position'
 const HIGHLIGHTS_STORAGE_KEY = 'leining_highlights'
 const SPEED_STORAGE_KEY = 'leining_wpm'
+const ALIYOT_STORAGE_KEY = 'leining_aliyot_refs'
+const ALIYOT_CACHE_TTL_MS = 7 * 24 * 60 * 60 * 1000 // one week
 
 export function saveHighlights(highlighted: Set<string>): void {
   try {
@@ -60,3 +62,26 @@ export function loadPosition(): ReadingPosition | null {
     return null
   }
 }
+
+/** Persist the aliyah refs (wholeRef → aliyot refs) fetched from the Sefaria book indexes. */
+export function saveAliyotRefs(aliyotByRef: Map<string, string[]>): void {
+  try {
+    localStorage.setItem(ALIYOT_STORAGE_KEY, JSON.stringify({ savedAt: Date.now(), refs: [...aliyotByRef] }))
+  } catch {
+    // ignore storage errors
+  }
+}
+
+/** Load the stored aliyah refs (returns null if missing, malformed, or older than a week). */
+export function loadAliyotRefs(): Map<string, string[]> | null {
+  try {
+    const raw = localStorage.getItem(ALIYOT_STORAGE_KEY)
+    if (!raw) return null
+    const stored = JSON.parse(raw) as { savedAt?: unknown; refs?: unknown }
+    if (typeof stored.savedAt !== 'number' || !Array.isArray(stored.refs)) return null
+    if (Date.now() - stored.savedAt > ALIYOT_CACHE_TTL_MS) return null
+    return new Map(stored.refs as [string, string[]][])
+  } catch {
+    return null
+  }
+}